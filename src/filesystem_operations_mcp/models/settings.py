@@ -2,11 +2,20 @@
 Settings models for the Bulk Filesystem Operations MCP server.
 """
 
+import sys
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import Literal
 
-DEFAULT_SKIP_LIST = [
+
+def _freeze_patterns(*patterns: str) -> tuple[str, ...]:
+    """
+    Interns and de-duplicates a list of patterns, preserving their order.
+    """
+    return tuple(dict.fromkeys(sys.intern(pattern) for pattern in patterns))
+
+
+DEFAULT_SKIP_LIST = _freeze_patterns(
     "**/.?*/**",
     ".?*/**", # exclude hidden folders
     "**/.?*", # exclude hidden files
@@ -22,9 +31,9 @@ DEFAULT_SKIP_LIST = [
     "*__pycache__/*",
     "**/.venv/**",
     ".venv/*",
-]
+)
 
-DEFAULT_SKIP_READ = [
+DEFAULT_SKIP_READ = _freeze_patterns(
     "*.pyc",
     "*.pyo",
     "*.pyd",
@@ -59,38 +68,46 @@ DEFAULT_SKIP_READ = [
     "*.swo",
     "*~",
     "*#",
-]
+)
+
+
 class FilesystemOperationsMCPSettings(BaseSettings):
     """
     Configuration settings for the Bulk Filesystem Operations MCP server.
 
     These settings can be loaded from environment variables or a .env file.
+    They are read once when the server starts and are immutable afterwards.
     """
 
-    model_config = SettingsConfigDict()
+    model_config = SettingsConfigDict(frozen=True)
     mcp_transport: Literal["stdio", "sse"] = Field(
         default="stdio",
         alias="mcp_transport",
         description="The transport protocol for the MCP server, e.g., 'stdio', 'sse",
     )
-    disabled_file_tools: list[str] = Field(
-        default_factory=list,
+    disabled_file_tools: tuple[str, ...] = Field(
+        default=(),
         alias="disabled_file_tools",
         description="List of disabled file tools provided by DISABLED_FILE_TOOLS environment variable.",
     )
-    disabled_folder_tools: list[str] = Field(
-        default_factory=list,
+    disabled_folder_tools: tuple[str, ...] = Field(
+        default=(),
         alias="disabled_folder_tools",
         description="List of disabled folder tools provided by DISABLED_FOLDER_TOOLS environment variable.",
     )
-    read_file_exclusions: list[str] = Field(
-        default_factory=lambda: DEFAULT_SKIP_READ,
+    read_file_exclusions: tuple[str, ...] = Field(
+        default=DEFAULT_SKIP_READ,
         alias="read_file_exclusions",
         description="List of file patterns to exclude from all multi-read operations.",
     )
-    list_folder_exclusions: list[str] = Field(
-        default_factory=lambda: DEFAULT_SKIP_LIST,
+    list_folder_exclusions: tuple[str, ...] = Field(
+        default=DEFAULT_SKIP_LIST,
         alias="list_folder_exclusions",
         description="List of folder patterns to exclude from listing operations.",
     )
+    content_cache_enabled: bool = Field(
+        default=True,
+        alias="content_cache_enabled",
+        description="Whether to cache the contents of files that have not changed since they were last read.",
+    )
     
@@ -18,6 +18,7 @@ from filesystem_operations_mcp.servers.multi_file_operations import FileOperatio
 from filesystem_operations_mcp.servers.multi_folder_operations import (
     FolderOperations,
 )
+from filesystem_operations_mcp.utils.file_reading import ContentCache
 
 logger: Logger = getLogger(__name__)
 
@@ -49,8 +50,14 @@ def main():
         dependencies=["fastmcp"],
     )
 
+    # Share a cache of recently read file contents between the file and folder tools
+    content_cache = ContentCache() if settings.content_cache_enabled else None
+
     # Register the tools for file manipulation, disabling any specified in settings
-    file_operations = FileOperations(denied_operations=settings.disabled_file_tools)
+    file_operations = FileOperations(
+        denied_operations=settings.disabled_file_tools,
+        content_cache=content_cache,
+    )
     file_operations.register_all(file_mcp)
 
     # Register the tools for folder manipulation, disabling any specified in settings
@@ -58,6 +65,7 @@ def main():
         denied_operations=settings.disabled_folder_tools,
         read_file_exclusions=settings.read_file_exclusions,
         list_folder_exclusions=settings.list_folder_exclusions,
+        content_cache=content_cache,
     )
     folder_operations.register_all(folder_mcp)
 
@@ -1,40 +1,58 @@
 """
 MCP Server for performing file operations.
 
-This server provides tools for reading, creating, appending, erasing, moving,
-and deleting files, with centralized exception handling.
+This server provides tools for reading, creating, appending, erasing, copying,
+moving, and deleting files, with centralized exception handling.
 """
 
-from logging import getLogger
+import asyncio
+from collections.abc import Sequence
 import os
+import shutil
 from fastmcp import Context
-from fastmcp.contrib.mcp_mixin import MCPMixin, mcp_tool
+from fastmcp.contrib.mcp_mixin import mcp_tool
 from filesystem_operations_mcp.utils.exception_handling import handle_file_errors
+from filesystem_operations_mcp.utils.file_moving import move_path
+from filesystem_operations_mcp.utils.file_reading import ContentCache, read_text
+from filesystem_operations_mcp.utils.tool_registration import ContentCacheMCPMixin
 
-logger = getLogger(__name__)
 
+def _write_text(file_path: str, content: str, mode: str) -> None:
+    """
+    Writes content to a text file. Blocking, intended to be run in a worker thread.
+
+    The content is encoded once and written straight to an unbuffered file,
+    skipping the chunked encoding and buffering of a text mode file.
+    """
+    if os.linesep != "\n":
+        content = content.replace("\n", os.linesep)
+
+    data = memoryview(content.encode("utf-8"))
+    with open(file_path, mode + "b", buffering=0) as f:
+        while data:
+            data = data[f.write(data) :]
 
-class FileOperations(MCPMixin):
+
+class FileOperations(ContentCacheMCPMixin):
     """
     This class provides MCP tools to manipulate files.
 
-    It includes methods for reading, creating, appending, erasing, moving,
-    and deleting files, with integrated custom exception handling.
+    It includes methods for reading, creating, appending, erasing, copying,
+    moving, and deleting files, with integrated custom exception handling.
     """
 
-    def __init__(self, denied_operations: list[str] | None = None):
+    def __init__(
+        self,
+        denied_operations: Sequence[str] | None = None,
+        content_cache: ContentCache | None = None,
+    ):
         """
         Initializes the FileOperations class.
         Args:
             denied_operations: A list of operations that should be denied.
+            content_cache: An optional cache of file contents shared between tools.
         """
-        if denied_operations is not None:
-            for operation in denied_operations:
-                if hasattr(self, operation):
-                    delattr(FileOperations, operation)
-                    logger.info(f"Disabled file tool: {operation}")
-
-        super().__init__()
+        super().__init__(denied_operations, content_cache)
 
     @mcp_tool()
     async def read(self, ctx: Context, file_path: str) -> str:
@@ -47,9 +65,9 @@ class FileOperations(MCPMixin):
         Returns:
             str: The content of the file.
         """
-        async with handle_file_errors(file_path):
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
+        with handle_file_errors(file_path):
+            reader = self.content_cache.read_text if self.content_cache else read_text
+            content = await asyncio.to_thread(reader, file_path)
             await ctx.info(f"File read successfully from {file_path}")
             return content
 
@@ -65,9 +83,9 @@ class FileOperations(MCPMixin):
         Returns:
             bool: True if the file was created successfully, False otherwise.
         """
-        async with handle_file_errors(file_path):
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.write(content)
+        with handle_file_errors(file_path):
+            await asyncio.to_thread(_write_text, file_path, content, "w")
+            self._invalidate(file_path)
             await ctx.info(f"File created successfully at {file_path}")
             return True
 
@@ -83,9 +101,9 @@ class FileOperations(MCPMixin):
         Returns:
             bool: True if the content was appended successfully, False otherwise.
         """
-        async with handle_file_errors(file_path):
-            with open(file_path, "a", encoding="utf-8") as f:
-                f.write(content)
+        with handle_file_errors(file_path):
+            await asyncio.to_thread(_write_text, file_path, content, "a")
+            self._invalidate(file_path)
             await ctx.info(f"Content appended successfully to {file_path}")
             return True
 
@@ -100,12 +118,30 @@ class FileOperations(MCPMixin):
         Returns:
             bool: True if the file was erased successfully, False otherwise.
         """
-        async with handle_file_errors(file_path):
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.write("")
+        with handle_file_errors(file_path):
+            await asyncio.to_thread(_write_text, file_path, "", "w")
+            self._invalidate(file_path)
             await ctx.info(f"File content erased successfully at {file_path}")
             return True
 
+    @mcp_tool()
+    async def copy(self, ctx: Context, source_path: str, destination_path: str) -> bool:
+        """
+        Copies a file from source to destination.
+
+        Args:
+            source_path: The path of the file to copy.
+            destination_path: The path where the copy should be created.
+
+        Returns:
+            bool: True if the file was copied successfully, False otherwise.
+        """
+        with handle_file_errors(source_path):
+            await asyncio.to_thread(shutil.copy2, source_path, destination_path)
+            self._invalidate(destination_path)
+            await ctx.info(f"File copied from {source_path} to {destination_path}")
+            return True
+
     @mcp_tool()
     async def move(self, ctx: Context, source_path: str, destination_path: str) -> bool:
         """
@@ -118,8 +154,9 @@ class FileOperations(MCPMixin):
         Returns:
             bool: True if the file was moved successfully, False otherwise.
         """
-        async with handle_file_errors(source_path):
-            os.rename(source_path, destination_path)
+        with handle_file_errors(source_path):
+            await asyncio.to_thread(move_path, source_path, destination_path)
+            self._invalidate(source_path, destination_path)
             await ctx.info(f"File moved from {source_path} to {destination_path}")
             return True
 
@@ -134,7 +171,8 @@ class FileOperations(MCPMixin):
         Returns:
             bool: True if the file was deleted successfully, False otherwise.
         """
-        async with handle_file_errors(file_path):
+        with handle_file_errors(file_path):
             os.remove(file_path)
+            self._invalidate(file_path)
             await ctx.info(f"File deleted successfully at {file_path}")
             return True
@@ -5,16 +5,23 @@ This server provides tools for creating, listing contents, moving, deleting,
 and emptying folders, with centralized exception handling.
 """
 
-from fnmatch import fnmatch
+import asyncio
+import errno
+import fnmatch
+import functools
+import re
+from collections import deque
+from collections.abc import Callable, Iterator, Sequence
+from itertools import islice
 from fastmcp import Context
-from fastmcp.contrib.mcp_mixin import MCPMixin, mcp_tool
+from fastmcp.contrib.mcp_mixin import mcp_tool
 from pydantic import BaseModel, Field
 from filesystem_operations_mcp.utils.exception_handling import handle_folder_errors
+from filesystem_operations_mcp.utils.file_moving import move_path
+from filesystem_operations_mcp.utils.file_reading import ContentCache, read_text
+from filesystem_operations_mcp.utils.tool_registration import ContentCacheMCPMixin
 import os
 import shutil
-from logging import getLogger
-
-logger = getLogger(__name__)
 
 
 class BaseMultiFileReadResult(BaseModel):
@@ -50,10 +57,14 @@ class FileReadSummary(BaseModel):
     """
     A model to summarize the results of reading files.
 
+    Successful reads and errors are kept in separate lists so consumers can
+    iterate either one without checking the type of each entry.
+
     Attributes:
-        total_files (int): The total number of files read.
-        successful_reads (int): The number of files read successfully.
+        total_files (int): The total number of files processed.
+        skipped_files (int): The number of files skipped due to exclusions.
         errors (list[FileReadError]): A list of errors encountered while reading files.
+        results (list[FileReadSuccess]): A list of successfully read files with their content.
     """
 
     total_files: int = Field(default=0, description="Total number of files processed")
@@ -70,7 +81,284 @@ class FileReadSummary(BaseModel):
     )
 
 
-class FolderOperations(MCPMixin):
+_GLOB_MAGIC = re.compile(r"[*?[]")
+
+
+def _classify(pattern: str) -> tuple[str, str]:
+    """
+    Classifies a glob pattern by the cheapest way it can be matched.
+
+    Args:
+        pattern: The glob pattern to classify.
+
+    Returns:
+        tuple[str, str]: The kind of pattern ("literal", "suffix", "prefix" or "regex")
+         and the string to match with.
+    """
+    if not _GLOB_MAGIC.search(pattern):
+        return "literal", pattern
+    if pattern.startswith("*") and not _GLOB_MAGIC.search(pattern, 1):
+        return "suffix", pattern[1:]
+    if pattern.endswith("*") and not _GLOB_MAGIC.search(pattern[:-1]):
+        return "prefix", pattern[:-1]
+    return "regex", pattern
+
+
+class _GlobSet:
+    """
+    A compiled set of glob patterns.
+
+    Literal patterns, `*.ext` patterns and `**/name/**` folder patterns are checked
+    with set lookups, other `*suffix` and `prefix*` patterns with
+    `str.endswith`/`str.startswith`, and only the remaining patterns go through a
+    single union regular expression.
+
+    Like `fnmatch.fnmatch`, patterns and paths are compared after `os.path.normcase`,
+    so on Windows matching ignores case and treats `/` and `\\` alike.
+    """
+
+    __slots__ = (
+        "literals",
+        "extensions",
+        "components",
+        "prefixes",
+        "suffixes",
+        "regex",
+    )
+
+    def __init__(self, patterns: tuple[str, ...]):
+        literals: set[str] = set()
+        extensions: set[str] = set()
+        components: set[str] = set()
+        prefixes: list[str] = []
+        suffixes: list[str] = []
+        regex_patterns: list[str] = []
+
+        for pattern in patterns:
+            pattern = os.path.normcase(pattern)
+            kind, value = _classify(pattern)
+            name = pattern[3:-3]
+            if (
+                pattern.startswith("**" + os.sep)
+                and pattern.endswith(os.sep + "**")
+                and name
+                and os.sep not in name
+                and not _GLOB_MAGIC.search(name)
+            ):
+                # `**/name/**` matches exactly when a folder between the first and
+                # last parts of the path is called name; after normcase, the
+                # separators of both the pattern and the path are os.sep
+                components.add(name)
+            elif kind == "literal":
+                literals.add(value)
+            elif kind == "suffix" and value.rfind(".") == 0:
+                # A suffix with a single leading dot matches exactly when it
+                # equals everything from the last dot of the path onwards
+                extensions.add(value)
+            elif kind == "suffix":
+                suffixes.append(value)
+            elif kind == "prefix":
+                prefixes.append(value)
+            else:
+                regex_patterns.append(fnmatch.translate(value))
+
+        self.literals = frozenset(literals)
+        self.extensions = frozenset(extensions)
+        self.components = frozenset(components)
+        self.prefixes = tuple(prefixes)
+        self.suffixes = tuple(suffixes)
+        self.regex = re.compile("|".join(regex_patterns)) if regex_patterns else None
+
+    def match(self, path: str) -> bool:
+        """
+        Checks if the path matches any of the glob patterns.
+        """
+        path = os.path.normcase(path)
+        return (
+            path in self.literals
+            or path[path.rfind(".") :] in self.extensions
+            or (
+                bool(self.components)
+                and not self.components.isdisjoint(path.split(os.sep)[1:-1])
+            )
+            or path.endswith(self.suffixes)
+            or path.startswith(self.prefixes)
+            or (self.regex is not None and self.regex.match(path) is not None)
+        )
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_globset(patterns: tuple[str, ...]) -> _GlobSet | None:
+    """
+    Compiles a set of glob patterns into a single matcher.
+
+    The result is cached so that repeated calls with the same patterns skip
+    the glob classification and regex compilation entirely.
+
+    Args:
+        patterns: The glob patterns to compile.
+
+    Returns:
+        _GlobSet | None: A matcher for any of the globs, or None if there are no patterns.
+    """
+    if not patterns:
+        return None
+    return _GlobSet(patterns)
+
+
+def _compile_match(patterns: tuple[str, ...]) -> Callable[[str], bool] | None:
+    """
+    Compiles a set of glob patterns and returns the bound match method of the
+    matcher, or None if there are no patterns.
+    """
+    globset = _compile_globset(patterns)
+    return globset.match if globset is not None else None
+
+
+def _prunable_patterns(patterns: Sequence[str]) -> tuple[str, ...]:
+    """
+    Finds the exclusion patterns that exclude everything below a matching folder.
+
+    A pattern like `**/.git/**` or `.venv/*` excludes every file under any folder
+    matching `**/.git` or `.venv`, so those folders do not need to be walked at all.
+
+    Args:
+        patterns: The exclusion patterns applied to relative file paths.
+
+    Returns:
+        tuple[str, ...]: Patterns matching the relative paths of folders that can be skipped.
+    """
+    prunable = []
+    for pattern in patterns:
+        for suffix in ("/**", "/*"):
+            if pattern.endswith(suffix) and len(pattern) > len(suffix):
+                prunable.append(pattern[: -len(suffix)])
+                break
+    return tuple(prunable)
+
+
+def _iter_files(
+    folder_path: str, prune: Callable[[str], bool] | None = None
+) -> Iterator[tuple[str, os.DirEntry[str]]]:
+    """
+    Recursively walks a folder with `os.scandir`, yielding every file.
+
+    Unlike `os.walk`, the directory entries are kept so callers can reuse the
+    file type information gathered while listing the directory. Symlinks to
+    folders are not followed, and unreadable subfolders are skipped.
+
+    Args:
+        folder_path: The path of the folder to walk.
+        prune: An optional check on the relative path of each subfolder; matching
+         subfolders are not walked.
+
+    Yields:
+        tuple[str, os.DirEntry]: The path of the file relative to the folder and its directory entry.
+    """
+    # Each folder carries its path relative to the walked folder, so relative
+    # paths are built by concatenation rather than by slicing the full path
+    stack: list[tuple[str, str]] = [(folder_path, "")]
+
+    while stack:
+        dir_, rel_dir = stack.pop()
+        rel_prefix = rel_dir or "." + os.sep
+        subdirs: list[tuple[str, str]] = []
+
+        try:
+            entries = os.scandir(dir_)
+        except OSError:
+            if not rel_dir:
+                raise
+            continue
+
+        with entries:
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+
+                if not is_dir:
+                    yield rel_prefix + entry.name, entry
+                elif not entry.is_symlink():
+                    rel_subdir = rel_dir + entry.name
+                    if prune is None or not prune(rel_subdir):
+                        subdirs.append((entry.path, rel_subdir + os.sep))
+
+        # Visit subfolders in listing order, depth first
+        stack.extend(reversed(subdirs))
+
+
+# Upper bound on the files read at once by `read_all`, keeping open file
+# descriptors and queued worker thread jobs in check on large folders
+_MAX_CONCURRENT_READS = 32
+
+# Shared messages for the common read errors, looked up by errno
+_READ_ERROR_MESSAGES = {
+    errno.ENOENT: "File not found",
+    errno.EACCES: "Permission denied",
+    errno.EPERM: "Permission denied",
+    errno.EISDIR: "Is a directory",
+}
+
+
+def _is_file(entry: os.DirEntry[str]) -> bool:
+    """
+    Checks if a directory entry is a file, following symlinks like `os.path.isfile`.
+
+    For entries that are not symlinks the answer comes from the file type gathered
+    while listing the folder, without another `stat`.
+    """
+    try:
+        return entry.is_file()
+    except OSError:
+        return False
+
+
+def _read_one(
+    file_path: str,
+    file: str,
+    head: int,
+    tail: int,
+    content_cache: ContentCache | None = None,
+) -> FileReadSuccess | FileReadError:
+    """
+    Reads a single file, capturing any error.
+
+    This is a blocking function intended to be run in a worker thread.
+
+    Args:
+        file_path: The path of the file to read.
+        file: The path of the file as reported in the result, relative to the folder.
+        head: Number of lines to read from the start of the file (0 reads all).
+        tail: Number of lines to read from the end of the file (0 reads all).
+        content_cache: An optional cache to serve whole-file reads from.
+
+    Returns:
+        FileReadSuccess | FileReadError: The content of the file or the error encountered.
+    """
+    try:
+        if head <= 0 and tail <= 0:
+            if content_cache is not None:
+                content = content_cache.read_text(file_path)
+            else:
+                content = read_text(file_path)
+        else:
+            with open(file_path, "r", encoding="utf-8", errors="strict") as f:
+                if head > 0:
+                    content = "".join(islice(f, head))
+                else:
+                    # Keep only the last lines while streaming through the file
+                    content = "".join(deque(f, maxlen=tail))
+    except OSError as e:
+        error = _READ_ERROR_MESSAGES.get(e.errno) or str(e)
+        return FileReadError(file_path=file, error=error)
+    except Exception as e:
+        return FileReadError(file_path=file, error=str(e))
+    return FileReadSuccess(file_path=file, content=content)
+
+
+class FolderOperations(ContentCacheMCPMixin):
     """
     This class provides MCP tools to manipulate folders.
 
@@ -78,36 +366,36 @@ class FolderOperations(MCPMixin):
     and emptying folders, with integrated custom exception handling.
     """
 
-    read_file_exclusions: list[str] = Field(
-        default_factory=list,
-        description="List of file patterns to exclude from all multi-read operations.",
-    )
-    list_folder_exclusions: list[str] = Field(
-        default_factory=list,
-        description="List of folder patterns to exclude from listing operations.",
-    )
+    read_file_exclusions: tuple[str, ...]
+    list_folder_exclusions: tuple[str, ...]
 
     def __init__(
         self,
-        denied_operations: list[str] | None = None,
-        list_folder_exclusions: list[str] | None = None,
-        read_file_exclusions: list[str] | None = None,
+        denied_operations: Sequence[str] | None = None,
+        list_folder_exclusions: Sequence[str] | None = None,
+        read_file_exclusions: Sequence[str] | None = None,
+        content_cache: ContentCache | None = None,
     ):
         """
         Initializes the FolderOperations class.
         Args:
             denied_operations: A list of operations that should be denied.
+            list_folder_exclusions: File patterns to exclude from all listing operations.
+            read_file_exclusions: File patterns to exclude from all multi-read operations.
+            content_cache: An optional cache of file contents shared between tools.
         """
-        if denied_operations is not None:
-            for operation in denied_operations:
-                if hasattr(self, operation):
-                    delattr(FolderOperations, operation)
-                    logger.info(f"Disabled folder tool: {operation}")
+        self.read_file_exclusions = tuple(read_file_exclusions or ())
+        self.list_folder_exclusions = tuple(list_folder_exclusions or ())
 
-        self.read_file_exclusions = read_file_exclusions or []
-        self.list_folder_exclusions = list_folder_exclusions or []
+        # The exclusions are fixed for the lifetime of the server, so compile them
+        # once and keep their bound match methods for the listing loops
+        self._list_excluded = _compile_match(self.list_folder_exclusions)
+        self._read_excluded = _compile_match(self.read_file_exclusions)
+        self._list_pruned = _compile_match(
+            _prunable_patterns(self.list_folder_exclusions)
+        )
 
-        super().__init__()
+        super().__init__(denied_operations, content_cache)
 
     @mcp_tool()
     async def create(self, ctx: Context, folder_path: str) -> bool:
@@ -120,32 +408,74 @@ class FolderOperations(MCPMixin):
         Returns:
             bool: True if the folder was created successfully, False otherwise.
         """
-        async with handle_folder_errors(folder_path):
+        with handle_folder_errors(folder_path):
             os.makedirs(folder_path, exist_ok=True)
             await ctx.info(f"Folder created successfully at {folder_path}")
             return True
 
-    def _matches_globs(self, path: str, include: list[str], exclude: list[str]) -> bool:
+    def _select_files(
+        self,
+        folder_path: str,
+        include: list[str],
+        exclude: list[str],
+        recurse: bool,
+        bypass_default_exclusions: bool,
+    ) -> tuple[list[tuple[str, os.DirEntry[str]]], int]:
         """
-        Checks if the given path matches the include and exclude glob patterns.
+        Lists the entries of a folder that pass the include, exclude and default
+        exclusion patterns, along with their directory entries.
 
-        Args:
-            path: The path to check.
-            include: A list of glob patterns to include specific files.
-            exclude: A list of glob patterns to exclude specific files.
+        The directory entries carry the file type gathered while listing the folder,
+        so callers can check for files without another `stat` per entry. Like
+        `contents`, the include and exclude patterns only apply when recursing.
+
+        This is a blocking method intended to be run in a worker thread.
 
         Returns:
-            bool: True if the path matches the include patterns and does not match the exclude patterns.
+            tuple[list[tuple[str, os.DirEntry]], int]: The relative paths and directory entries,
+             in listing order, and the number of entries left out by the include and exclude patterns.
         """
-
-        if include:
-            included = any(fnmatch(path, pat) for pat in include)
+        default_excluded = None if bypass_default_exclusions else self._list_excluded
+
+        if not recurse:
+            with os.scandir(folder_path) as entries:
+                selected = [
+                    (entry.name, entry)
+                    for entry in entries
+                    if default_excluded is None or not default_excluded(entry.name)
+                ]
+            return selected, 0
+
+        # Compile the patterns once, outside of the walk, combining the
+        # requested exclusions with the default ones into a single matcher
+        if not exclude:
+            excluded = default_excluded
+        elif bypass_default_exclusions:
+            excluded = _compile_match(tuple(exclude))
         else:
-            included = True
+            excluded = _compile_match(tuple(exclude) + self.list_folder_exclusions)
+
+        included = _compile_match(tuple(include))
 
-        excluded = any(fnmatch(path, pat) for pat in exclude)
+        # Skip walking folders whose files would all be excluded anyway
+        prune = None if bypass_default_exclusions else self._list_pruned
 
-        return included and not excluded
+        # Entries rejected by the combined matcher only count as filtered when the
+        # default exclusions would have kept them
+        selected = []
+        filtered = 0
+        for rel_file, entry in _iter_files(folder_path, prune):
+            if excluded is not None and excluded(rel_file):
+                if default_excluded is None or not default_excluded(rel_file):
+                    filtered += 1
+                continue
+
+            if included is None or included(rel_file):
+                selected.append((rel_file, entry))
+            else:
+                filtered += 1
+
+        return selected, filtered
 
     @mcp_tool()
     async def contents(
@@ -172,41 +502,24 @@ class FolderOperations(MCPMixin):
         Returns:
             list: A list of items in the folder.
         """
-        async with handle_folder_errors(folder_path):
-            contents = []
-
-            if recurse:
-                for dir_, _, files in os.walk(folder_path):
-                    for file_name in files:
-                        rel_dir = os.path.relpath(dir_, folder_path)
-                        rel_file = os.path.join(rel_dir, file_name)
-
-                        if not bypass_default_exclusions:
-                            # Check if the file matches any default exclusion patterns
-                            if not self._matches_globs(
-                                rel_file,
-                                include=["*"],
-                                exclude=self.list_folder_exclusions,
-                            ):
-                                await ctx.debug(
-                                    f"Skipping file due to folder exclusions: {rel_file}"
-                                )
-                                continue
-
-                        if self._matches_globs(rel_file, include, exclude):
-                            contents.append(rel_file)
-                            await ctx.debug(f"Included file: {rel_file}")
-            else:
-                contents = os.listdir(folder_path)
-                for file in contents:
-                    if not self._matches_globs(
-                        file, include=["*"], exclude=self.list_folder_exclusions
-                    ):
-                        await ctx.debug(
-                            f"Skipping file due to folder exclusions: {file}"
-                        )
-                        contents.remove(file)
+        # Accept path objects from direct callers; the walk only needs a string
+        folder_path = os.fspath(folder_path)
+
+        with handle_folder_errors(folder_path):
+            # Walk the folder in a worker thread so the event loop stays free
+            selected, filtered = await asyncio.to_thread(
+                self._select_files,
+                folder_path,
+                include,
+                exclude,
+                recurse,
+                bypass_default_exclusions,
+            )
+            contents = [rel_file for rel_file, _ in selected]
 
+            # A single summary rather than a message per file keeps large listings
+            # from round-tripping through the context for every entry
+            await ctx.debug(f"Included {len(contents)} items, filtered out {filtered}")
             await ctx.info(f"Contents of {folder_path} listed successfully")
             return contents
 
@@ -227,6 +540,9 @@ class FolderOperations(MCPMixin):
          If you are listing items recursively, the include and exclude patterns will
          apply to the relative path of the items. So to capture all files of a certain type
          in a folder and its subfolders, you would use a pattern like `**/*.txt` for `include`.
+         All of the file contents are returned in a single response, so for large folders
+         prefer listing the folder with `contents` and reading the files you need in batches,
+         or use `head`/`tail` to limit how much of each file is returned.
 
         Args:
             folder_path: The path of the folder to list.
@@ -238,53 +554,90 @@ class FolderOperations(MCPMixin):
             bypass_default_exclusions: If True, skips the default exclusions for reading files.
 
         Returns:
-            list[FileReadSuccess | FileReadError]: A list of results containing the file path and content or error.
+            FileReadSummary: The successfully read files with their content, and any errors, in separate lists.
         """
-        async with handle_folder_errors(folder_path):
-            files = await self.contents(
-                ctx, folder_path, include, exclude, recurse, bypass_default_exclusions
+        folder_path = os.fspath(folder_path)
+
+        with handle_folder_errors(folder_path):
+            # Count the files left out by the patterns in the same pass as the listing
+            selected, skipped_count = await asyncio.to_thread(
+                self._select_files,
+                folder_path,
+                include,
+                exclude,
+                recurse,
+                bypass_default_exclusions,
             )
-            unfiltered_file_count = len(
-                await self.contents(
-                    ctx, folder_path, [], [], recurse, bypass_default_exclusions
-                )
-            )
-
-            results: list[FileReadSuccess] = []
-            errors: list[FileReadError] = []
 
-            for file in files:
-                file_path = os.path.join(folder_path, file)
+            read_excluded = None if bypass_default_exclusions else self._read_excluded
+            readable_files: list[tuple[str, str]] = []
+            excluded_count = 0
 
-                if not bypass_default_exclusions:
-                    # Check if the file matches any default exclusion patterns
-                    if not self._matches_globs(
-                        file, include=["*"], exclude=self.read_file_exclusions
-                    ):
-                        await ctx.debug(f"Skipping file due to exclusion: {file_path}")
-                        continue
+            for file, entry in selected:
+                # Check if the file matches any default exclusion patterns
+                if read_excluded and read_excluded(file):
+                    excluded_count += 1
+                    continue
 
-                if not os.path.isfile(file_path):
+                if not _is_file(entry):
                     continue
-                try:
-                    with open(file_path, "r", encoding="utf-8", errors="strict") as f:
-                        if head > 0:
-                            content = "".join(f.readlines()[:head])
-                        elif tail > 0:
-                            f.seek(0, os.SEEK_END)
-                            f.seek(max(0, f.tell() - tail), os.SEEK_SET)
-                            content = f.read()
-                        else:
-                            content = f.read()
-                    results.append(FileReadSuccess(file_path=file, content=content))
-                    await ctx.debug(f"File read successfully: {file_path}")
-                except Exception as e:
-                    errors.append(FileReadError(file_path=file, error=str(e)))
-                    await ctx.error(f"Error reading file {file_path}: {e}")
+
+                readable_files.append((file, entry.path))
+
+            if excluded_count:
+                await ctx.debug(f"Skipped {excluded_count} files due to exclusions")
+
+            # Read the files concurrently in worker threads so the event loop stays free
+            semaphore = asyncio.Semaphore(_MAX_CONCURRENT_READS)
+
+            async def read_bounded(
+                file: str, file_path: str
+            ) -> FileReadSuccess | FileReadError:
+                async with semaphore:
+                    return await asyncio.to_thread(
+                        _read_one, file_path, file, head, tail, self.content_cache
+                    )
+
+            tasks = [
+                asyncio.create_task(read_bounded(file, file_path))
+                for file, file_path in readable_files
+            ]
+
+            # Report progress in steps of 1% rather than for every file
+            total = len(tasks)
+            progress_step = max(1, total // 100)
+
+            # Stop the remaining reads if the call is cancelled or reporting fails
+            try:
+                for completed, task in enumerate(asyncio.as_completed(tasks), start=1):
+                    await task
+                    if completed % progress_step == 0 or completed == total:
+                        await ctx.report_progress(completed, total)
+            finally:
+                for task in tasks:
+                    task.cancel()
+
+            # Gather the results in listing order rather than completion order
+            results: list[FileReadSuccess] = []
+            errors: list[FileReadError] = []
+
+            for task in tasks:
+                result = task.result()
+                if isinstance(result, FileReadError):
+                    errors.append(result)
+                else:
+                    results.append(result)
+
+            if errors:
+                await ctx.error(
+                    f"Errors reading {len(errors)} files:\n"
+                    + "\n".join(f"{error.file_path}: {error.error}" for error in errors)
+                )
+            await ctx.info(f"Read {len(results)}/{total} files from {folder_path}")
 
             return FileReadSummary(
-                total_files=len(files),
-                skipped_files=unfiltered_file_count - len(files),
+                total_files=len(selected),
+                skipped_files=skipped_count,
                 errors=errors,
                 results=results,
             )
@@ -301,8 +654,9 @@ class FolderOperations(MCPMixin):
         Returns:
             bool: True if the folder was moved successfully, False otherwise.
         """
-        async with handle_folder_errors(source_path):
-            os.rename(source_path, destination_path)
+        with handle_folder_errors(source_path):
+            await asyncio.to_thread(move_path, source_path, destination_path)
+            self._invalidate(source_path, destination_path)
             await ctx.info(f"Folder moved from {source_path} to {destination_path}")
             return True
 
@@ -320,10 +674,11 @@ class FolderOperations(MCPMixin):
         Returns:
             bool: True if the folder was deleted successfully, False otherwise.
         """
-        async with handle_folder_errors(folder_path):
+        with handle_folder_errors(folder_path):
             if recursive:
                 shutil.rmtree(folder_path)
             else:
                 os.rmdir(folder_path)
+            self._invalidate(folder_path)
             await ctx.info(f"Folder deleted successfully at {folder_path}")
             return True
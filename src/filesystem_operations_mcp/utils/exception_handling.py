@@ -2,7 +2,7 @@
 Utility functions for centralized exception handling.
 """
 
-from contextlib import asynccontextmanager
+from contextlib import contextmanager
 from filesystem_operations_mcp.models.errors import (
     MCPFileOperationError,
     MCPFolderOperationError,
@@ -11,31 +11,37 @@ from filesystem_operations_mcp.models.errors import (
 )
 
 
-@asynccontextmanager
-async def handle_file_errors(path: str):
+@contextmanager
+def handle_file_errors(path: str):
     """
-    Async context manager to handle file operation exceptions.
+    Context manager to handle file operation exceptions.
+
+    Only filesystem and text encoding errors are translated; anything else is a bug
+    and propagates unchanged.
     """
     try:
         yield
-    except FileNotFoundError:
-        raise MCPFileNotFoundError(path)
+    except FileNotFoundError as e:
+        raise MCPFileNotFoundError(path) from e
     except PermissionError as e:
-        raise MCPFileOperationError(f"Permission denied: {e}", path)
-    except Exception as e:
-        raise MCPFileOperationError(f"An unexpected error occurred: {e}", path)
+        raise MCPFileOperationError(f"Permission denied: {e}", path) from e
+    except (OSError, UnicodeError) as e:
+        raise MCPFileOperationError(f"An unexpected error occurred: {e}", path) from e
 
 
-@asynccontextmanager
-async def handle_folder_errors(path: str):
+@contextmanager
+def handle_folder_errors(path: str):
     """
-    Async context manager to handle folder operation exceptions.
+    Context manager to handle folder operation exceptions.
+
+    Only filesystem and text encoding errors are translated; anything else is a bug
+    and propagates unchanged.
     """
     try:
         yield
-    except FileNotFoundError:
-        raise MCPFolderNotFoundError(path)
+    except FileNotFoundError as e:
+        raise MCPFolderNotFoundError(path) from e
     except PermissionError as e:
-        raise MCPFolderOperationError(f"Permission denied: {e}", path)
-    except Exception as e:
-        raise MCPFolderOperationError(f"An unexpected error occurred: {e}", path)
+        raise MCPFolderOperationError(f"Permission denied: {e}", path) from e
+    except (OSError, UnicodeError) as e:
+        raise MCPFolderOperationError(f"An unexpected error occurred: {e}", path) from e
@@ -0,0 +1,29 @@
+"""
+Utility functions for moving files and folders.
+"""
+
+import errno
+import os
+import shutil
+
+
+def move_path(source_path: str, destination_path: str) -> None:
+    """
+    Moves a file or folder, renaming it in place when possible.
+
+    A rename is a single system call whatever the size of the file or folder, but
+    only works within one filesystem. Moves across filesystems fall back to
+    `shutil.move`, which copies the data and then removes the source.
+
+    This is a blocking function intended to be run in a worker thread.
+
+    Args:
+        source_path: The current path of the file or folder.
+        destination_path: The new path of the file or folder.
+    """
+    try:
+        os.replace(source_path, destination_path)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(source_path, destination_path)
@@ -0,0 +1,190 @@
+"""
+Utility functions for reading file contents.
+"""
+
+import os
+import stat
+import threading
+import time
+from collections import OrderedDict
+
+_BUFFER_SIZE = 64 * 1024
+
+# Files modified this recently may change again without their modification time
+# moving, 2 seconds being the coarsest granularity in common use (FAT)
+_RACY_WINDOW_NS = 2_000_000_000
+
+# Files with a NUL byte this close to the start are treated as binary
+_SNIFF_SIZE = 8 * 1024
+
+_thread_local = threading.local()
+
+
+def _get_buffer() -> memoryview:
+    """
+    Returns the read buffer for the current thread, allocating it on first use.
+    """
+    buffer = getattr(_thread_local, "buffer", None)
+    if buffer is None:
+        buffer = _thread_local.buffer = memoryview(bytearray(_BUFFER_SIZE))
+    return buffer
+
+
+def _normalize_newlines(text: str) -> str:
+    """
+    Translates line endings the same way text mode `open()` does.
+    """
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def read_text(file_path: str) -> str:
+    """
+    Reads the full content of a UTF-8 text file.
+
+    Binary files, detected by a NUL byte in the first 8 KiB, are rejected with a
+    `UnicodeDecodeError` without reading the rest of the file.
+
+    Small files are read into a per-thread buffer that is reused across calls
+    and decoded in one step, avoiding the intermediate `bytes` object and the
+    incremental decoder of a text mode file. Larger files are read whole in
+    binary mode and also decoded in one step, with the kernel advised to read
+    ahead aggressively where supported.
+
+    Args:
+        file_path: The path of the file to read.
+
+    Returns:
+        str: The content of the file.
+    """
+    return _read_text(file_path)[0]
+
+
+def _read_text(file_path: str) -> tuple[str, int]:
+    """
+    Reads the full content of a UTF-8 text file, along with the number of bytes read.
+    """
+    with open(file_path, "rb", buffering=0) as f:
+        buffer = _get_buffer()
+        length = f.readinto(buffer[:_SNIFF_SIZE])
+
+        nul = buffer.obj.find(b"\0", 0, length)
+        if nul != -1:
+            raise UnicodeDecodeError(
+                "utf-8", bytes(buffer[:length]), nul, nul + 1, "binary file"
+            )
+
+        while length < _BUFFER_SIZE:
+            read = f.readinto(buffer[length:])
+            if not read:
+                return _normalize_newlines(str(buffer[:length], "utf-8")), length
+            length += read
+
+        # Rereading the start from the page cache is cheaper than joining it
+        # onto the rest of a large file
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        f.seek(0)
+        data = f.readall()
+
+    return _normalize_newlines(str(data, "utf-8")), len(data)
+
+
+class ContentCache:
+    """
+    A bounded, least-recently-used cache of text file contents.
+
+    Entries are validated against the file's modification time and size, so a
+    cache hit costs a single `os.stat` instead of an open, read and close. Only
+    regular files last modified a few seconds ago or earlier are cached, so that
+    those can be trusted to change along with the content.
+    Safe to use from multiple worker threads.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 128 * 1024 * 1024,
+        max_file_bytes: int = 1024 * 1024,
+    ):
+        """
+        Initializes the ContentCache class.
+        Args:
+            max_bytes: The total size of the files kept in the cache.
+            max_file_bytes: Files larger than this are read but never cached.
+        """
+        self.max_bytes = max_bytes
+        self.max_file_bytes = max_file_bytes
+
+        self._entries: OrderedDict[str, tuple[int, int, str]] = OrderedDict()
+        self._cached_bytes = 0
+        self._lock = threading.Lock()
+
+    def read_text(self, file_path: str) -> str:
+        """
+        Reads the full content of a UTF-8 text file, using the cached content if
+        the file has not changed since it was last read.
+
+        Args:
+            file_path: The path of the file to read.
+
+        Returns:
+            str: The content of the file.
+        """
+        path = os.path.abspath(file_path)
+        st = os.stat(path)
+
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry[:2] == (st.st_mtime_ns, st.st_size):
+                self._entries.move_to_end(path)
+                return entry[2]
+
+        content, length = _read_text(path)
+
+        # Only cache files whose stat describes their content. Files in procfs and
+        # sysfs are not regular or do not report their real size, and like git's
+        # racy index entries, a file modified just now may be rewritten again
+        # without its modification time changing
+        if (
+            stat.S_ISREG(st.st_mode)
+            and length == st.st_size <= self.max_file_bytes
+            and time.time_ns() - st.st_mtime_ns >= _RACY_WINDOW_NS
+        ):
+            with self._lock:
+                previous = self._entries.pop(path, None)
+                if previous is not None:
+                    self._cached_bytes -= previous[1]
+
+                self._entries[path] = (st.st_mtime_ns, st.st_size, content)
+                self._cached_bytes += st.st_size
+
+                while self._cached_bytes > self.max_bytes:
+                    _, (_, size, _) = self._entries.popitem(last=False)
+                    self._cached_bytes -= size
+
+        return content
+
+    def invalidate(self, *paths: str) -> None:
+        """
+        Drops the cached content of files, or of every file under folders.
+
+        Called after the tools write, move or delete a path, so correctness does
+        not rely on the modification time changing, which filesystems with coarse
+        timestamps may not do for a quick same-size rewrite.
+
+        Args:
+            paths: The paths of the files or folders that changed.
+        """
+        for path in paths:
+            path = os.path.abspath(path)
+            prefix = path.rstrip(os.sep) + os.sep
+
+            with self._lock:
+                for key in [
+                    key
+                    for key in self._entries
+                    if key == path or key.startswith(prefix)
+                ]:
+                    _, size, _ = self._entries.pop(key)
+                    self._cached_bytes -= size
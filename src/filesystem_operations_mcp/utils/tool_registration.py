@@ -0,0 +1,76 @@
+"""
+Utilities for registering MCP tools.
+"""
+
+from collections.abc import Sequence
+from logging import getLogger
+
+from fastmcp.contrib.mcp_mixin import MCPMixin
+from filesystem_operations_mcp.utils.file_reading import ContentCache
+
+logger = getLogger(__name__)
+
+
+class DeniableMCPMixin(MCPMixin):
+    """
+    An MCPMixin whose tools can be denied per instance.
+
+    Denied tools are left out at registration rather than removed from the class,
+    so other instances keep their own set of tools. This relies on overriding
+    `MCPMixin._get_methods_to_register`, which is private to fastmcp, so the
+    override is kept here in one place.
+    """
+
+    def __init__(self, denied_operations: Sequence[str] | None = None):
+        """
+        Initializes the DeniableMCPMixin class.
+        Args:
+            denied_operations: A list of operations that should be denied.
+        """
+        self._denied_operations = frozenset(denied_operations or ())
+        for operation in self._denied_operations:
+            if hasattr(self, operation):
+                logger.info(f"Disabled {type(self).__name__} tool: {operation}")
+
+        super().__init__()
+
+    def _get_methods_to_register(self, registration_type: str):
+        """
+        Retrieves the methods marked for registration, leaving out denied operations.
+        """
+        return [
+            (method, registration_info)
+            for method, registration_info in super()._get_methods_to_register(
+                registration_type
+            )
+            if method.__name__ not in self._denied_operations
+        ]
+
+
+class ContentCacheMCPMixin(DeniableMCPMixin):
+    """
+    A DeniableMCPMixin whose tools share an optional cache of file contents, and
+    drop the cached contents of the paths they change.
+    """
+
+    def __init__(
+        self,
+        denied_operations: Sequence[str] | None = None,
+        content_cache: ContentCache | None = None,
+    ):
+        """
+        Initializes the ContentCacheMCPMixin class.
+        Args:
+            denied_operations: A list of operations that should be denied.
+            content_cache: An optional cache of file contents shared between tools.
+        """
+        self.content_cache = content_cache
+
+        super().__init__(denied_operations)
+
+    def _invalidate(self, *paths: str) -> None:
+        """
+        Drops cached contents under the given paths after the tool changed them.
+        """
+        if self.content_cache is not None:
+            self.content_cache.invalidate(*paths)
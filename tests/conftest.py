@@ -0,0 +1,13 @@
+"""
+Shared fixtures for the test suite.
+"""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+
+@pytest.fixture
+def mock_ctx():
+    """Fixture to provide a mock Context whose logging and progress methods can be awaited."""
+    return AsyncMock()
@@ -2,6 +2,8 @@
 Tests for the exception handling context managers.
 """
 
+from collections.abc import Callable
+
 import pytest
 from filesystem_operations_mcp.utils.exception_handling import (
     handle_file_errors,
@@ -14,31 +16,48 @@ from filesystem_operations_mcp.models.errors import (
     MCPFolderNotFoundError,
 )
 
-# Parametrized test data for handle_file_errors
-file_error_scenarios = [
+# Parametrized test data for handle_file_errors, with the exceptions built only when raised
+file_error_scenarios = (
     (FileNotFoundError, MCPFileNotFoundError, "File not found", "test_file.txt"),
     (
-        PermissionError("Permission denied"),
+        lambda: PermissionError("Permission denied"),
         MCPFileOperationError,
         "Permission denied",
         "test_file.txt",
     ),
     (
-        Exception("Some other error"),
+        lambda: OSError("Some other error"),
+        MCPFileOperationError,
+        "An unexpected error occurred",
+        "test_file.txt",
+    ),
+    (
+        lambda: UnicodeDecodeError("utf-8", b"\xff", 0, 1, "invalid start byte"),
         MCPFileOperationError,
         "An unexpected error occurred",
         "test_file.txt",
     ),
-]
+    (
+        lambda: UnicodeEncodeError("utf-8", "\ud800", 0, 1, "surrogates not allowed"),
+        MCPFileOperationError,
+        "An unexpected error occurred",
+        "test_file.txt",
+    ),
+    (
+        lambda: ValueError("Some other error"),
+        ValueError,
+        "Some other error",
+        "test_file.txt",
+    ),
+)
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "raised_exception, expected_exception, exception_match, file_path",
     file_error_scenarios,
 )
-async def test_handle_file_errors(
-    raised_exception: Exception,
+def test_handle_file_errors(
+    raised_exception: Callable[[], Exception],
     expected_exception: type[Exception],
     exception_match: str,
     file_path: str,
@@ -47,15 +66,12 @@ async def test_handle_file_errors(
     Test the handle_file_errors context manager for different built-in exceptions.
 
     Verifies that the context manager catches specific built-in exceptions
-    (FileNotFoundError, PermissionError) and general Exceptions, and raises
+    (FileNotFoundError, PermissionError) and other OS and decoding errors, and raises
     the corresponding custom MCP exceptions with the correct message and file path.
     """
     with pytest.raises(expected_exception, match=exception_match) as excinfo:
-        async with handle_file_errors(file_path):
-            if isinstance(raised_exception, type):
-                raise raised_exception
-            else:
-                raise raised_exception
+        with handle_file_errors(file_path):
+            raise raised_exception()
 
     if hasattr(excinfo.value, "file_path"):
         assert isinstance(excinfo.value, expected_exception)
@@ -64,31 +80,48 @@ async def test_handle_file_errors(
         assert file_path_value == file_path
 
 
-# Parametrized test data for handle_folder_errors
-folder_error_scenarios = [
+# Parametrized test data for handle_folder_errors, with the exceptions built only when raised
+folder_error_scenarios = (
     (FileNotFoundError, MCPFolderNotFoundError, "Folder not found", "test_folder"),
     (
-        PermissionError("Permission denied"),
+        lambda: PermissionError("Permission denied"),
         MCPFolderOperationError,
         "Permission denied",
         "test_folder",
     ),
     (
-        Exception("Some other error"),
+        lambda: OSError("Some other error"),
         MCPFolderOperationError,
         "An unexpected error occurred",
         "test_folder",
     ),
-]
+    (
+        lambda: UnicodeDecodeError("utf-8", b"\xff", 0, 1, "invalid start byte"),
+        MCPFolderOperationError,
+        "An unexpected error occurred",
+        "test_folder",
+    ),
+    (
+        lambda: UnicodeEncodeError("utf-8", "\ud800", 0, 1, "surrogates not allowed"),
+        MCPFolderOperationError,
+        "An unexpected error occurred",
+        "test_folder",
+    ),
+    (
+        lambda: ValueError("Some other error"),
+        ValueError,
+        "Some other error",
+        "test_folder",
+    ),
+)
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "raised_exception, expected_exception, exception_match, folder_path",
     folder_error_scenarios,
 )
-async def test_handle_folder_errors(
-    raised_exception: Exception,
+def test_handle_folder_errors(
+    raised_exception: Callable[[], Exception],
     expected_exception: type[Exception],
     exception_match: str,
     folder_path: str,
@@ -97,15 +130,12 @@ async def test_handle_folder_errors(
     Test the handle_folder_errors context manager for different built-in exceptions.
 
     Verifies that the context manager catches specific built-in exceptions
-    (FileNotFoundError, PermissionError) and general Exceptions, and raises
+    (FileNotFoundError, PermissionError) and other OS and decoding errors, and raises
     the corresponding custom MCP exceptions with the correct message and folder path.
     """
     with pytest.raises(expected_exception, match=exception_match) as excinfo:
-        async with handle_folder_errors(folder_path):
-            if isinstance(raised_exception, type):
-                raise raised_exception
-            else:
-                raise raised_exception
+        with handle_folder_errors(folder_path):
+            raise raised_exception()
 
     if hasattr(excinfo.value, "folder_path"):
         assert isinstance(excinfo.value, expected_exception)
@@ -0,0 +1,50 @@
+"""
+Tests for the file moving utilities.
+"""
+
+import errno
+import os
+
+import pytest
+from filesystem_operations_mcp.utils.file_moving import move_path
+
+
+def test_move_path_renames(tmp_path):
+    """
+    Test that move_path moves files and folders within a filesystem.
+    """
+    (tmp_path / "folder").mkdir()
+    (tmp_path / "folder" / "file.txt").write_text("content")
+
+    move_path(str(tmp_path / "folder"), str(tmp_path / "moved"))
+    move_path(str(tmp_path / "moved" / "file.txt"), str(tmp_path / "file.txt"))
+
+    assert not (tmp_path / "folder").exists()
+    assert (tmp_path / "file.txt").read_text() == "content"
+
+
+def test_move_path_across_filesystems(tmp_path, monkeypatch):
+    """
+    Test that move_path falls back to copying when the rename crosses filesystems.
+    """
+    (tmp_path / "folder").mkdir()
+    (tmp_path / "folder" / "file.txt").write_text("content")
+
+    def replace(source_path, destination_path):
+        raise OSError(errno.EXDEV, os.strerror(errno.EXDEV))
+
+    monkeypatch.setattr(os, "replace", replace)
+    monkeypatch.setattr(os, "rename", replace)
+
+    move_path(str(tmp_path / "folder"), str(tmp_path / "moved"))
+
+    assert not (tmp_path / "folder").exists()
+    assert (tmp_path / "moved" / "file.txt").read_text() == "content"
+
+
+def test_move_path_other_errors(tmp_path):
+    """
+    Test that move_path raises errors other than a cross-filesystem rename.
+    """
+    with pytest.raises(FileNotFoundError):
+        move_path(str(tmp_path / "missing"), str(tmp_path / "moved"))
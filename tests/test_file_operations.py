@@ -3,20 +3,13 @@ Simplified tests for file operations, focusing on methods with logic beyond simp
 Exception handling for simple operations is covered by tests for the context managers.
 """
 
+import os
+import time
+
 import pytest
+from filesystem_operations_mcp.models.errors import MCPFileOperationError
 from filesystem_operations_mcp.servers.multi_file_operations import FileOperations
-
-
-# Mock Context for testing
-class MockContext:
-    def info(self, message):
-        pass  # Suppress print during tests
-
-    def warning(self, message):
-        pass  # Suppress print during tests
-
-    def error(self, message):
-        pass  # Suppress print during tests
+from filesystem_operations_mcp.utils.file_reading import ContentCache
 
 
 @pytest.fixture
@@ -25,11 +18,64 @@ def file_operations():
     return FileOperations()
 
 
-@pytest.fixture
-def mock_ctx():
-    """Fixture to provide a MockContext instance."""
-    return MockContext()
-
-
 # No tests for simple file operations methods as their exception handling is covered by context manager tests.
 # Add tests here only for FileOperations methods with logic beyond simple os.* calls.
+
+
+async def test_create_append_read(file_operations, mock_ctx, tmp_path):
+    """
+    Tests that content written by create and append is read back unchanged,
+    including non-ASCII content written through the encoded write path.
+    """
+    file_path = str(tmp_path / "file.txt")
+
+    assert await file_operations.create(mock_ctx, file_path, "héllo\n")
+    assert await file_operations.append(mock_ctx, file_path, "wörld" * 20_000)
+
+    content = await file_operations.read(mock_ctx, file_path)
+
+    assert content == "héllo\n" + "wörld" * 20_000
+
+
+async def test_copy(file_operations, mock_ctx, tmp_path):
+    """
+    Tests that copy creates a destination with the same content and leaves the
+    source in place.
+    """
+    source_path = str(tmp_path / "source.txt")
+    destination_path = str(tmp_path / "destination.txt")
+
+    assert await file_operations.create(mock_ctx, source_path, "héllo\n")
+    assert await file_operations.copy(mock_ctx, source_path, destination_path)
+
+    assert await file_operations.read(mock_ctx, destination_path) == "héllo\n"
+    assert await file_operations.read(mock_ctx, source_path) == "héllo\n"
+
+
+async def test_create_invalidates_cached_content(mock_ctx, tmp_path):
+    """
+    Tests that a rewrite through the tools is read back even when it keeps the
+    file's size and modification time, which the content cache validates against.
+    """
+    file_operations = FileOperations(content_cache=ContentCache())
+    file_path = str(tmp_path / "file.txt")
+
+    # Date the file back past the window in which it would be too recent to cache
+    an_hour_ago = time.time_ns() - 3600 * 1_000_000_000
+
+    assert await file_operations.create(mock_ctx, file_path, "teh")
+    os.utime(file_path, ns=(an_hour_ago, an_hour_ago))
+    assert await file_operations.read(mock_ctx, file_path) == "teh"
+
+    assert await file_operations.create(mock_ctx, file_path, "the")
+    os.utime(file_path, ns=(an_hour_ago, an_hour_ago))
+
+    assert await file_operations.read(mock_ctx, file_path) == "the"
+
+
+async def test_create_unencodable_content(file_operations, mock_ctx, tmp_path):
+    """
+    Tests that content which cannot be encoded as UTF-8 surfaces as a tool error.
+    """
+    with pytest.raises(MCPFileOperationError, match="An unexpected error occurred"):
+        await file_operations.create(mock_ctx, str(tmp_path / "file.txt"), "a\ud800b")
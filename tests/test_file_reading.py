@@ -0,0 +1,156 @@
+"""
+Tests for the file reading utilities.
+"""
+
+import os
+import time
+
+import pytest
+from filesystem_operations_mcp.utils.file_reading import ContentCache, read_text
+
+
+def _write_old_text(path, text: str) -> None:
+    """
+    Writes a file and moves its modification time an hour back, past the window
+    in which the content cache considers a file too recently modified to cache.
+    """
+    path.write_text(text)
+    an_hour_ago = time.time_ns() - 3600 * 1_000_000_000
+    os.utime(path, ns=(an_hour_ago, an_hour_ago))
+
+
+@pytest.mark.parametrize(
+    "data, expected",
+    [
+        (b"", ""),
+        (b"hello", "hello"),
+        ("héllo".encode("utf-8"), "héllo"),
+        (b"one\r\ntwo\rthree\n", "one\ntwo\nthree\n"),
+        (b"x" * 100_000, "x" * 100_000),
+        (b"line\r\n" * 20_000, "line\n" * 20_000),
+    ],
+)
+def test_read_text(tmp_path, data: bytes, expected: str):
+    """
+    Test that read_text returns the same content as reading the file in text mode,
+    for files both smaller and larger than the reusable read buffer.
+    """
+    file_path = tmp_path / "file.txt"
+    file_path.write_bytes(data)
+
+    assert read_text(str(file_path)) == expected
+
+
+def test_read_text_invalid_utf8(tmp_path):
+    """
+    Test that read_text raises a UnicodeDecodeError for content that is not UTF-8.
+    """
+    file_path = tmp_path / "file.bin"
+    file_path.write_bytes(b"\xff\xfe")
+
+    with pytest.raises(UnicodeDecodeError):
+        read_text(str(file_path))
+
+
+def test_read_text_binary(tmp_path):
+    """
+    Test that read_text rejects files with a NUL byte near the start as binary.
+    """
+    file_path = tmp_path / "file.bin"
+    file_path.write_bytes(b"text\x00" + b"x" * 100_000)
+
+    with pytest.raises(UnicodeDecodeError, match="binary file"):
+        read_text(str(file_path))
+
+
+def test_content_cache_invalidates_on_change(tmp_path):
+    """
+    Test that the content cache serves unchanged files from memory and re-reads
+    files whose modification time or size changed.
+    """
+    file_path = tmp_path / "file.txt"
+    _write_old_text(file_path, "first")
+    cache = ContentCache()
+
+    assert cache.read_text(str(file_path)) == "first"
+
+    # Rewrite the file behind the cache's back, keeping the size and modification time
+    stat = file_path.stat()
+    file_path.write_text("other")
+    os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert cache.read_text(str(file_path)) == "first"
+
+    file_path.write_text("second version")
+    assert cache.read_text(str(file_path)) == "second version"
+
+
+def test_content_cache_evicts_least_recently_used(tmp_path):
+    """
+    Test that the content cache stays within its byte budget and skips files
+    that are too large to cache.
+    """
+    cache = ContentCache(max_bytes=10, max_file_bytes=8)
+    paths = []
+    for name in ("a", "b", "c"):
+        path = tmp_path / name
+        _write_old_text(path, name * 4)
+        paths.append(str(path))
+        cache.read_text(str(path))
+
+    large = tmp_path / "large"
+    _write_old_text(large, "x" * 9)
+    cache.read_text(str(large))
+
+    assert list(cache._entries) == [os.path.abspath(p) for p in paths[1:]]
+    assert cache._cached_bytes == 8
+
+
+def test_content_cache_invalidate(tmp_path):
+    """
+    Test that invalidating a file or folder drops the cached contents under it,
+    leaving entries for sibling paths with the same prefix in place.
+    """
+    folder = tmp_path / "folder"
+    folder.mkdir()
+    paths = [folder / "a.txt", folder / "b.txt", tmp_path / "folder2.txt"]
+    cache = ContentCache()
+    for path in paths:
+        _write_old_text(path, path.name)
+        cache.read_text(str(path))
+
+    cache.invalidate(str(paths[0]))
+    assert list(cache._entries) == [os.path.abspath(p) for p in paths[1:]]
+
+    cache.invalidate(str(folder), str(tmp_path / "missing"))
+    assert list(cache._entries) == [os.path.abspath(paths[2])]
+    assert cache._cached_bytes == len("folder2.txt")
+
+
+def test_content_cache_skips_recently_modified_files(tmp_path):
+    """
+    Test that a file modified within the racy window is read but not cached, so
+    a same-size rewrite that keeps its modification time is still picked up.
+    """
+    file_path = tmp_path / "file.txt"
+    file_path.write_text("first")
+    cache = ContentCache()
+
+    assert cache.read_text(str(file_path)) == "first"
+    assert not cache._entries
+
+    stat = file_path.stat()
+    file_path.write_text("other")
+    os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert cache.read_text(str(file_path)) == "other"
+
+
+@pytest.mark.skipif(not os.path.exists("/proc/uptime"), reason="requires procfs")
+def test_content_cache_skips_procfs_files():
+    """
+    Test that files whose size does not match their content, like procfs files
+    reporting a size of zero, are never cached.
+    """
+    cache = ContentCache()
+
+    assert cache.read_text("/proc/uptime")
+    assert not cache._entries
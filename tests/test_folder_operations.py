@@ -1,20 +1,22 @@
-import pytest
+import asyncio
+import ntpath
 import os
+import pytest
 import shutil
-from unittest.mock import MagicMock
-from filesystem_operations_mcp.servers.multi_folder_operations import FolderOperations, FileReadSuccess, FileReadError, FileReadSummary
+import time
+from filesystem_operations_mcp.servers import multi_folder_operations
+from filesystem_operations_mcp.servers.multi_folder_operations import FolderOperations, FileReadSummary, _GlobSet, _compile_globset, _compile_match
 from filesystem_operations_mcp.models.settings import DEFAULT_SKIP_READ, DEFAULT_SKIP_LIST
+from filesystem_operations_mcp.utils.file_reading import ContentCache
 
 
-class MockContext:
-    def info(self, message):
-        pass
-
-    def debug(self, message):
-        pass
-
-    def error(self, message):
-        pass
+@pytest.fixture(scope="module")
+def folder_operations():
+    """Fixture providing a FolderOperations instance with the default exclusions, shared across the module."""
+    return FolderOperations(
+        list_folder_exclusions=DEFAULT_SKIP_LIST,
+        read_file_exclusions=DEFAULT_SKIP_READ
+    )
 
 @pytest.mark.parametrize(
     "path, include, exclude, expected",
@@ -32,175 +34,225 @@ class MockContext:
         (".venv/file.py", [], DEFAULT_SKIP_LIST, False),
         ("src/.venv/file.py", [], DEFAULT_SKIP_LIST, False),
         ("src/__pycache__/file.py", [], DEFAULT_SKIP_LIST, False),
+        ("src/__pycache__/file.pyc", [], DEFAULT_SKIP_READ, False),
+        ("src/module.py", [], DEFAULT_SKIP_READ, True),
+        ("notes.txt~", [], DEFAULT_SKIP_READ, False),
+        ("photos/Thumbs.db", [], DEFAULT_SKIP_READ, False),
+        ("build/lib.so.txt", [], DEFAULT_SKIP_READ, True),
+        ("dist/archive.tar.gz", [], ["*.gz"], False),
+        ("dist/archive.tar.gz", [], ["*.tar"], True),
+        ("web/node_modules/lib/index.js", [], ["**/node_modules/**"], False),
+        ("node_modules/index.js", [], ["**/node_modules/**"], True),
+        ("web/node_modules", [], ["**/node_modules/**"], True),
     ],
 )
 def test_matches_globs(path, include, exclude, expected):
-    folder_operations = FolderOperations()
-    result = folder_operations._matches_globs(path, include, exclude)
+    """Tests the include and exclude matchers the way `_select_files` applies them to each listed path."""
+    included = _compile_match(tuple(include))
+    excluded = _compile_match(tuple(exclude))
+
+    result = (included is None or included(path)) and not (excluded is not None and excluded(path))
+
     assert result == expected
 
-@pytest.fixture
-def setup_test_folder(tmp_path):
-    """Fixture to set up a temporary folder structure for testing."""
-    base_dir = "." / tmp_path / "test_folder"
-    base_dir.mkdir()
+@pytest.mark.parametrize(
+    "path, patterns",
+    [
+        ("subdir\\file3.txt", ("**/*.txt",)),
+        ("src\\.git\\config", DEFAULT_SKIP_LIST),
+        ("FILE.TXT", ("*.txt",)),
+    ],
+)
+def test_globset_windows_paths(monkeypatch, path, patterns):
+    """Tests that, like fnmatch on Windows, matching ignores case and treats both separators alike."""
+    monkeypatch.setattr(os.path, "normcase", ntpath.normcase)
+
+    assert _GlobSet(patterns).match(path)
+
+def test_globset_folder_names_windows_paths(monkeypatch):
+    """Tests that `**/name/**` patterns split Windows paths on the same separator the walker joins them with."""
+    monkeypatch.setattr(os.path, "normcase", ntpath.normcase)
+    monkeypatch.setattr(os, "sep", "\\")
+
+    globset = _GlobSet(("**/node_modules/**",))
+
+    assert globset.components == {"node_modules"}
+    assert globset.match("web\\node_modules\\index.js")
+    assert not globset.match("node_modules\\index.js")
+
+def test_globs_compiled_once():
+    """Tests that repeated glob checks reuse the compiled patterns rather than translating them again."""
+    patterns = ("**/*.txt", "*.csv")
+    assert _compile_globset(patterns) is _compile_globset(tuple(list(patterns)))
+
+@pytest.fixture(scope="session")
+def _golden_test_folder(tmp_path_factory):
+    """Fixture building the test folder structure once per session, to be copied by each test."""
+    base_dir = tmp_path_factory.mktemp("golden") / "test_folder"
 
     # Create files and folders, some matching default exclusions
-    (base_dir / "file1.txt").write_text("content1")
-    (base_dir / "file2.log").write_text("content2")
-    (base_dir / ".git").mkdir()
-    (base_dir / ".git" / "config").write_text("git config")
-    (base_dir / ".otherhidden").mkdir()
-    (base_dir / ".otherhidden" / "config").write_text("git config")
-    (base_dir / "__pycache__").mkdir()
-    (base_dir / "__pycache__" / "cache.pyc").write_text("cache")
-    (base_dir / "subdir").mkdir()
-    (base_dir / "subdir" / "file3.txt").write_text("content3")
-    (base_dir / "subdir" / ".venv").mkdir()
-    (base_dir / "subdir" / ".venv" / "script.py").write_text("script")
-    (base_dir / "subdir" / "data.csv").write_text("csv data")
+    for folder in (".git", ".otherhidden", "__pycache__", "subdir/.venv"):
+        (base_dir / folder).mkdir(parents=True)
+
+    files = {
+        "file1.txt": "content1",
+        "file2.log": "content2",
+        ".git/config": "git config",
+        ".otherhidden/config": "git config",
+        "__pycache__/cache.pyc": "cache",
+        "subdir/file3.txt": "content3",
+        "subdir/.venv/script.py": "script",
+        "subdir/data.csv": "csv data",
+    }
+    for file, content in files.items():
+        (base_dir / file).write_text(content)
 
     return base_dir
 
-@pytest.mark.asyncio
-async def test_contents_with_default_exclusions(setup_test_folder):
-    """Tests listing folder contents with default exclusions."""
-    folder_path = setup_test_folder
-    ctx = MockContext()
-    folder_operations = FolderOperations(
-        list_folder_exclusions=DEFAULT_SKIP_LIST,
-        read_file_exclusions=DEFAULT_SKIP_READ
-    )
+@pytest.fixture
+def setup_test_folder(tmp_path, _golden_test_folder):
+    """Fixture to set up a temporary folder structure for testing."""
+    base_dir = tmp_path / "test_folder"
+    shutil.copytree(_golden_test_folder, base_dir)
 
-    # List contents with default exclusions (recurse=True)
-    contents = await folder_operations.contents(ctx, str(folder_path), include=["**/*"], exclude=[], recurse=True)
+    return base_dir
 
-    # Expected files (excluding default list exclusions like .git, __pycache__, .venv)
-    expected_contents = [
-        "./file1.txt",
-        "./file2.log",
-        "subdir/file3.txt",
-        "subdir/data.csv",
-    ]
+# Expected files (excluding default exclusions like .git, __pycache__, .venv and .pyc)
+expected_files = {
+    "./file1.txt",
+    "./file2.log",
+    "subdir/file3.txt",
+    "subdir/data.csv",
+}
+
+# Expected files (including default exclusions)
+expected_all_files = {
+    ".git/config",
+    "__pycache__/cache.pyc",
+    ".otherhidden/config",
+    "./file1.txt",
+    "./file2.log",
+    "subdir/.venv/script.py",
+    "subdir/data.csv",
+    "subdir/file3.txt",
+}
 
-    # Sort for consistent comparison
-    contents.sort()
-    expected_contents.sort()
+@pytest.mark.parametrize(
+    "operation, bypass_default_exclusions, expected",
+    [
+        ("contents", False, expected_files),
+        ("contents", True, expected_all_files),
+        ("read_all", False, expected_files),
+        ("read_all", True, expected_all_files),
+    ],
+)
+async def test_folder_listings_and_reads(folder_operations, setup_test_folder, mock_ctx, operation, bypass_default_exclusions, expected):
+    """Tests listing and reading folder contents with and without the default exclusions."""
+    result = await getattr(folder_operations, operation)(mock_ctx, str(setup_test_folder), include=["**/*"], exclude=[], recurse=True, bypass_default_exclusions=bypass_default_exclusions)
 
-    assert contents == expected_contents
+    if operation == "read_all":
+        assert len(result.errors) == 0 # Assuming no read errors for these files
+        result = [file.file_path for file in result.results]
 
-@pytest.mark.asyncio
-async def test_contents_without_default_exclusions(setup_test_folder):
-    """Tests listing folder contents without default exclusions."""
+    assert set(result) == expected
+
+async def test_contents_with_include_only(folder_operations, setup_test_folder, mock_ctx):
+    """Tests listing folder contents with only include patterns."""
     folder_path = setup_test_folder
-    ctx = MockContext()
-    folder_operations = FolderOperations(
-        list_folder_exclusions=DEFAULT_SKIP_LIST,
-        read_file_exclusions=DEFAULT_SKIP_READ
-    )
 
-    # List contents without default exclusions (recurse=True, bypass_default_exclusions=True)
-    contents = await folder_operations.contents(ctx, str(folder_path), include=["**/*"], exclude=[], recurse=True, bypass_default_exclusions=True)
+    # List contents with only include pattern for .txt files
+    contents = await folder_operations.contents(mock_ctx, str(folder_path), include=["**/*.txt"], exclude=[], recurse=True)
 
-    # Expected files (including default list exclusions)
-    expected_contents = [
-        ".git/config",
-        "__pycache__/cache.pyc",
-        ".otherhidden/config",
+    # Expected files (only .txt files)
+    expected_contents = {
         "./file1.txt",
-        "./file2.log",
-        "subdir/.venv/script.py",
-        "subdir/data.csv",
         "subdir/file3.txt",
-    ]
+    }
 
-    # Sort for consistent comparison
-    contents.sort()
-    expected_contents.sort()
+    assert set(contents) == expected_contents
+
+async def test_read_all_counts_skipped_files(folder_operations, setup_test_folder, mock_ctx):
+    """Tests that only files left out by the include and exclude patterns count as skipped."""
+    folder_path = setup_test_folder
 
-    assert contents == expected_contents
+    summary: FileReadSummary = await folder_operations.read_all(mock_ctx, str(folder_path), include=["**/*.txt"], exclude=["**/file3.txt"], recurse=True)
 
-@pytest.mark.asyncio
-async def test_read_all_with_default_exclusions(setup_test_folder):
-    """Tests reading all files in a folder with default read exclusions."""
+    assert [result.file_path for result in summary.results] == ["./file1.txt"]
+    assert summary.total_files == 1
+    # file2.log, data.csv and file3.txt, but not the files under the default exclusions
+    assert summary.skipped_files == 3
+
+async def test_contents_non_recursive_with_exclusions(setup_test_folder, mock_ctx):
+    """Tests that a non-recursive listing drops every excluded item, including adjacent ones."""
     folder_path = setup_test_folder
-    ctx = MockContext()
-    folder_operations = FolderOperations(
-        read_file_exclusions=DEFAULT_SKIP_READ,
-        list_folder_exclusions=DEFAULT_SKIP_LIST
-    )
 
-    # Read all files with default exclusions (recurse=True)
-    summary: FileReadSummary = await folder_operations.read_all(ctx, str(folder_path), include=["**/*"], exclude=[], recurse=True)
+    folder_operations = FolderOperations(list_folder_exclusions=["file*", ".*"])
 
-    # Expected successful reads (excluding default read exclusions like .pyc)
-    expected_successful_files = [
-        "./file1.txt",
-        "./file2.log",
-        "subdir/file3.txt",
-        "subdir/data.csv",
-    ]
+    contents = await folder_operations.contents(mock_ctx, str(folder_path), include=[], exclude=[], recurse=False)
 
-    successful_files = [result.file_path for result in summary.results]
-    successful_files.sort()
-    expected_successful_files.sort()
+    assert set(contents) == {"__pycache__", "subdir"}
 
-    assert successful_files == expected_successful_files
-    assert len(summary.errors) == 0 # Assuming no read errors for these files
+async def test_read_all_head(folder_operations, tmp_path, mock_ctx):
+    """Tests that head returns only the first lines of each file."""
+    (tmp_path / "lines.txt").write_text("one\ntwo\nthree\n")
 
-@pytest.mark.asyncio
-async def test_read_all_without_default_exclusions(setup_test_folder):
-    """Tests reading all files in a folder without default read exclusions."""
-    folder_path = setup_test_folder
-    ctx = MockContext()
-    folder_operations = FolderOperations(
-        read_file_exclusions=DEFAULT_SKIP_READ,
-        list_folder_exclusions=DEFAULT_SKIP_LIST
-    )
+    summary: FileReadSummary = await folder_operations.read_all(mock_ctx, str(tmp_path), include=[], exclude=[], recurse=False, head=2)
 
-    # Read all files without default exclusions (recurse=True, bypass_default_exclusions=True)
-    summary: FileReadSummary = await folder_operations.read_all(ctx, str(folder_path), include=["**/*"], exclude=[], recurse=True, bypass_default_exclusions=True)
+    assert [result.content for result in summary.results] == ["one\ntwo\n"]
 
-    # Expected successful reads (including default read exclusions like .pyc)
-    expected_successful_files = [
-        ".git/config",
-        "__pycache__/cache.pyc",
-        "./file1.txt",
-        "./file2.log",
-        "subdir/.venv/script.py",
-        ".otherhidden/config",
-        "subdir/data.csv",
-        "subdir/file3.txt",
-    ]
+async def test_read_all_tail(folder_operations, tmp_path, mock_ctx):
+    """Tests that tail returns the last lines, not the last characters, of each file."""
+    (tmp_path / "lines.txt").write_text("one\ntwo\nthree\n")
 
-    successful_files = [result.file_path for result in summary.results]
-    successful_files.sort()
-    expected_successful_files.sort()
+    summary: FileReadSummary = await folder_operations.read_all(mock_ctx, str(tmp_path), include=[], exclude=[], recurse=False, tail=2)
 
-    assert successful_files == expected_successful_files
-    assert len(summary.errors) == 0 # Assuming no read errors for these files
+    assert [result.content for result in summary.results] == ["two\nthree\n"]
 
-@pytest.mark.asyncio
-async def test_contents_with_include_only(setup_test_folder):
-    """Tests listing folder contents with only include patterns."""
-    folder_path = setup_test_folder
-    ctx = MockContext()
-    folder_operations = FolderOperations(
-        list_folder_exclusions=DEFAULT_SKIP_LIST,
-        read_file_exclusions=DEFAULT_SKIP_READ
-    )
+async def test_contents_with_path_object(folder_operations, setup_test_folder, mock_ctx):
+    """Tests that the folder path can be given as a path object rather than a string."""
+    contents = await folder_operations.contents(mock_ctx, setup_test_folder, include=["**/*.txt"], exclude=[], recurse=True)
 
-    # List contents with only include pattern for .txt files
-    contents = await folder_operations.contents(ctx, str(folder_path), include=["**/*.txt"], exclude=[], recurse=True)
+    assert set(contents) == {"./file1.txt", "subdir/file3.txt"}
 
-    # Expected files (only .txt files)
-    expected_contents = [
-        "./file1.txt",
-        "subdir/file3.txt",
-    ]
+async def test_move_and_delete_invalidate_cached_contents(tmp_path, mock_ctx):
+    """Tests that moving or deleting a folder drops the cached contents of the files under it."""
+    content_cache = ContentCache()
+    folder_operations = FolderOperations(content_cache=content_cache)
+    (tmp_path / "source").mkdir()
+    (tmp_path / "source" / "file.txt").write_text("content")
+    # Date the file back past the window in which it would be too recent to cache
+    an_hour_ago = time.time_ns() - 3600 * 1_000_000_000
+    os.utime(tmp_path / "source" / "file.txt", ns=(an_hour_ago, an_hour_ago))
+
+    await folder_operations.read_all(mock_ctx, str(tmp_path / "source"), include=[], exclude=[], recurse=False)
+    assert len(content_cache._entries) == 1
+
+    assert await folder_operations.move(mock_ctx, str(tmp_path / "source"), str(tmp_path / "destination"))
+    assert not content_cache._entries
+
+    await folder_operations.read_all(mock_ctx, str(tmp_path / "destination"), include=[], exclude=[], recurse=False)
+    assert await folder_operations.delete(mock_ctx, str(tmp_path / "destination"), recursive=True)
+    assert not content_cache._entries
+
+async def test_read_all_stops_reading_when_reporting_fails(folder_operations, tmp_path, mock_ctx, monkeypatch):
+    """Tests that reads still waiting for a slot are cancelled when read_all exits early."""
+    for i in range(200):
+        (tmp_path / f"file{i}.txt").write_text("content")
+
+    started = []
+
+    def slow_read_one(*args):
+        started.append(args[1])
+        time.sleep(0.002)
+        return read_one(*args)
+
+    read_one = multi_folder_operations._read_one
+    monkeypatch.setattr(multi_folder_operations, "_read_one", slow_read_one)
+    mock_ctx.report_progress.side_effect = RuntimeError("client went away")
 
-    # Sort for consistent comparison
-    contents.sort()
-    expected_contents.sort()
+    with pytest.raises(RuntimeError, match="client went away"):
+        await folder_operations.read_all(mock_ctx, str(tmp_path), include=[], exclude=[], recurse=False)
 
-    assert contents == expected_contents
\ No newline at end of file
+    # Give reads that were not cancelled ample time to run
+    await asyncio.sleep(0.5)
+    assert len(started) < 200
@@ -0,0 +1,69 @@
+"""
+Tests for the MCP server setup and configuration.
+"""
+import pytest
+from fastmcp import FastMCP
+from filesystem_operations_mcp.models.settings import FilesystemOperationsMCPSettings
+from filesystem_operations_mcp.servers.multi_file_operations import FileOperations
+from filesystem_operations_mcp.servers.multi_folder_operations import FolderOperations
+
+
+@pytest.fixture
+def make_settings(monkeypatch):
+    """
+    Fixture providing a factory that builds the settings from the given environment variables.
+    """
+
+    def _make_settings(**env: str) -> FilesystemOperationsMCPSettings:
+        for name, value in env.items():
+            monkeypatch.setenv(name, value)
+        return FilesystemOperationsMCPSettings()
+
+    return _make_settings
+
+
+async def registered_tools(operations) -> set[str]:
+    """
+    Registers the tools of an operations class with a fresh server and returns their names.
+    """
+    mcp = FastMCP("test")
+    operations.register_tools(mcp)
+    return set(await mcp.get_tools())
+
+
+async def test_file_tool_exclusion(make_settings):
+    """
+    Test that file tools are correctly excluded based on DISABLED_FILE_TOOLS environment variable.
+    """
+
+    settings = make_settings(DISABLED_FILE_TOOLS='["delete","copy"]')
+
+    filtered_file_operations = FileOperations(
+        denied_operations=settings.disabled_file_tools
+    )
+    tools = await registered_tools(filtered_file_operations)
+
+    # 'move' and 'create' stay available while 'delete' and 'copy' are disabled
+    assert tools & {"move", "delete", "copy", "create"} == {"move", "create"}
+
+    # Denying tools on one instance must not affect others
+    assert "delete" in await registered_tools(FileOperations())
+
+
+async def test_folder_tool_exclusion(make_settings):
+    """
+    Test that folder tools are correctly excluded based on DISABLED_FOLDER_TOOLS environment variable.
+    """
+
+    settings = make_settings(DISABLED_FOLDER_TOOLS='["delete","copy"]')
+
+    filter_folder_operations = FolderOperations(
+        denied_operations=settings.disabled_folder_tools
+    )
+    tools = await registered_tools(filter_folder_operations)
+
+    # 'move' and 'create' stay available while 'delete' and 'copy' are disabled
+    assert tools & {"move", "delete", "copy", "create"} == {"move", "create"}
+
+    # Denying tools on one instance must not affect others
+    assert "delete" in await registered_tools(FolderOperations())